@@ -0,0 +1,316 @@
+# plots.py — data loading, filtering and figure construction for the
+# astronaut dashboard; astronauts.py composes these into the page.
+
+
+import os
+
+import streamlit as st
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+import plotly.io as pio
+from plotly.colors import sequential
+
+# --------------- Data Loading & Preprocessing ---------------
+# mission_role cleanup: exact-match dict, applied in one pass
+MISSION_ROLE_MAP = {
+    'other (journalist)': 'journalist',
+    'other (space tourist)': 'space tourist',
+    'psp': 'payload specialist',
+    'msp': 'mission specialist',
+}
+
+# only the columns the dashboard actually touches
+USECOLS = [
+    'Profile.Astronaut Numbers.Overall',
+    'Profile.Astronaut Numbers.Nationwide',
+    'Profile.Name',
+    'Profile.Gender',
+    'Profile.Nationality',
+    'Profile.Lifetime Statistics.EVA duration',
+    'Mission.Role',
+    'Mission.Year',
+]
+
+@st.cache_data
+def load_data(path):
+    # warm starts read the already-preprocessed frame back from Parquet
+    # (dtypes survive the round trip); the CSV is only re-parsed when it
+    # is newer than the cache
+    pq_path = path.rsplit('.', 1)[0] + '.parquet'
+    if (os.path.exists(pq_path)
+            and os.path.getmtime(pq_path) > os.path.getmtime(path)):
+        df = pd.read_parquet(pq_path)
+    else:
+        # pyarrow reader is multithreaded; dates are parsed post-load
+        # since the pyarrow engine doesn't take parse_dates
+        df = pd.read_csv(path, engine='pyarrow', usecols=USECOLS)
+        df['Mission.Year'] = pd.to_datetime(df['Mission.Year'], format='%Y')
+        df['year'] = df['Mission.Year'].dt.year
+
+        # normalize column names & clean up mission_role, EVA flag
+        # (done here so it runs once per process, not on every rerun)
+        df.columns = (
+            df.columns
+              .str.lower()
+              .str.replace('.', '_', regex=False)
+              .str.replace(' ', '_', regex=False)
+        )
+        # cast to Categorical first, then rename the handful of categories:
+        # O(n_categories) instead of rewriting the whole column
+        df['mission_role'] = (
+            df['mission_role']
+              .str.lower()
+              .astype('category')
+              .cat.rename_categories(MISSION_ROLE_MAP)
+        )
+        # kept as a plain bool column (1 byte/row); the yes/no labels are
+        # applied in plot_eva_pie on the two-row aggregate only
+        df['profile_eva_activity'] = (
+            df['profile_lifetime_statistics_eva_duration'].ne(0)
+        )
+
+        # low-cardinality string columns: store as Categorical so groupby,
+        # isin and value_counts work on integer codes instead of objects
+        for c in ('profile_gender', 'profile_nationality'):
+            df[c] = df[c].astype('category')
+
+        # sort by year once so the year filter can slice instead of masking
+        df = df.sort_values('year').reset_index(drop=True)
+        df.to_parquet(pq_path, compression='zstd')
+
+    # one row per astronaut, for the pie charts: dedupe once here instead
+    # of re-hashing the filtered frame on every rerun
+    unique_df = df.drop_duplicates('profile_name')[
+        ['profile_name', 'profile_gender', 'profile_nationality',
+         'profile_eva_activity', 'year']
+    ].reset_index(drop=True)
+
+    # cumulative astronaut count per year: the "overall number" is
+    # monotonic in mission date, so its per-year max is the running total.
+    # Computed once here; the plot only slices it by year range.
+    cum_by_year = (
+        df.groupby('year', as_index=False)
+          .agg({'profile_astronaut_numbers_overall': 'max'})
+          .rename(columns={'profile_astronaut_numbers_overall': 'cum_overall'})
+    )
+
+    # all-time astronauts per country for the choropleth: the per-country
+    # max of the nationwide "astronaut number" is that country's total
+    country_counts = (
+        df.groupby('profile_nationality', observed=True)
+          ['profile_astronaut_numbers_nationwide'].max()
+    )
+
+    # sidebar option lists, computed once here instead of on every rerun
+    genders = df['profile_gender'].cat.categories.tolist()
+    nats = df['profile_nationality'].cat.categories.tolist()
+    years = sorted(df['year'].unique().tolist())
+    return df, unique_df, cum_by_year, country_counts, genders, nats, years
+
+# --------------- Cached Filtering & Aggregations ---------------
+# keyed on the selections, so an unchanged sidebar is a cache hit
+@st.cache_data(show_spinner=False)
+def filter_df(df, selected_years, selected_genders, selected_nats):
+    year_arr = df['year'].values
+    full_genders = (
+        set(selected_genders) == set(df['profile_gender'].cat.categories)
+    )
+    full_nats = (
+        set(selected_nats) == set(df['profile_nationality'].cat.categories)
+    )
+
+    # nothing narrowed (the initial-load state): skip the filter entirely
+    if (full_genders and full_nats
+            and selected_years[0] <= year_arr[0]
+            and selected_years[1] >= year_arr[-1]):
+        return df
+
+    # df is sorted by year (see load_data), so the year range is a
+    # contiguous slice found by binary search instead of an O(n) mask
+    lo_i, hi_i = np.searchsorted(
+        year_arr, [selected_years[0], selected_years[1] + 1]
+    )
+    sub = df.iloc[lo_i:hi_i]
+
+    # only mask on gender/nationality when the user actually narrowed them
+    if not full_genders:
+        sub = sub[sub['profile_gender'].isin(selected_genders)]
+    if not full_nats:
+        sub = sub[sub['profile_nationality'].isin(selected_nats)]
+    return sub
+
+@st.cache_data(show_spinner=False)
+def agg_cumulative(cum_by_year, selected_years):
+    # O(years) slice of the table precomputed in load_data
+    return cum_by_year[
+        (cum_by_year['year'] >= selected_years[0]) &
+        (cum_by_year['year'] <= selected_years[1])
+    ]
+
+@st.cache_data(show_spinner=False)
+def agg_top_nats(df):
+    # one C-level pass: crosstab on the categorical columns yields the
+    # nationality x gender matrix directly (bincount on codes internally)
+    ct = pd.crosstab(df["profile_nationality"], df["profile_gender"])
+    totals = ct.sum(axis=1)
+    top = totals[totals > 0].nlargest(10).index
+    top10_list = top.tolist()
+
+    # tidy frame of the non-empty top-10 cells only
+    grp = (
+        ct.loc[top]
+          .reset_index()
+          .melt(id_vars="profile_nationality",
+                var_name="profile_gender", value_name="count")
+    )
+    grp = grp[grp["count"] > 0].reset_index(drop=True)
+    return grp, top10_list
+
+@st.cache_data(show_spinner=False)
+def agg_gender(unique_df):
+    # unique_df already holds one row per astronaut (see load_data)
+    return (
+        unique_df['profile_gender']
+               .value_counts()
+               .reset_index(name='count')
+               .rename(columns={'index':'gender'})
+    )
+
+@st.cache_data(show_spinner=False)
+def agg_eva(unique_df):
+    return (
+        unique_df["profile_eva_activity"]
+               .value_counts()
+               .reset_index(name='count')
+               .rename(columns={'index':'eva_activity'})
+    )
+
+# --------------- Plot Functions ---------------
+# figures are built with graph_objects directly: px.* re-infers columns,
+# hover templates and trace grouping from the DataFrame on every call
+#
+# all style setup lives here at module scope: one registered template
+# that Plotly compiles once, plus a layout dict shared by the
+# full-height charts (plot-specific keys are passed alongside)
+pio.templates['astro'] = pio.templates['plotly_white']
+pio.templates.default = 'astro'
+COLOR_SEQ = sequential.Magma
+#COLOR_SEQ = COLOR_SEQ1[::-1]
+BASE_LAYOUT = dict(height=800)
+
+# Plot 1: Cumulative overall astronauts over time
+# (aggregation is cached; figure construction stays outside the cache
+#  so Plotly objects aren't pickled)
+# NOTE: the cumulative overall count is independent of the gender and
+# nationality filters, so only the year range applies here.
+def plot_cumulative(cum, year_range):
+    yearly = agg_cumulative(cum, year_range)
+    # Scattergl renders via WebGL, so the browser side stays fast even if
+    # the series ever grows well beyond one point per year
+    fig = go.Figure(go.Scattergl(
+        x=yearly['year'].values,
+        y=yearly['cum_overall'].values,
+        mode='lines+markers',
+        line=dict(color=COLOR_SEQ[0])
+    ))
+    fig.update_layout(
+        **BASE_LAYOUT,
+        title="Number of Astronauts to have been in Space",
+        xaxis=dict(
+            title='year',
+            range=[1961,2019],
+            tickmode='linear',
+            tick0=1965,
+            dtick=5,
+            tickangle=-45
+        ),
+        yaxis=dict(title='Total # Astronauts'),
+        font=dict(size=40)
+    )
+    return fig
+
+# 2) Top 10 nationalities by gender, sorted by total count
+# CHANGED: Determine top 10 nationalities by overall count instead of alphabetical
+# CHANGED: Explicitly enforce category ordering for plotly to sort bars by count
+def plot_top_nats(df):
+    grp, top10_list = agg_top_nats(df)
+
+    # Create bar chart: one trace per gender, category order enforced
+    # on the x-axis so bars stay sorted by count
+    fig = go.Figure()
+    for i, gender in enumerate(grp["profile_gender"].unique()):
+        sub = grp[grp["profile_gender"] == gender]
+        fig.add_trace(go.Bar(
+            x=sub["profile_nationality"].values,
+            y=sub["count"].values,
+            name=gender,
+            marker_color=COLOR_SEQ[i % len(COLOR_SEQ)]
+        ))
+    fig.update_layout(
+        barmode='group',
+        title="Top 10 Nationalities by Gender",
+        xaxis=dict(
+            title="Country",
+            categoryorder='array',
+            categoryarray=top10_list,
+            tickangle=-45
+        ),
+        yaxis=dict(title="# Astronauts"),
+        height=600,
+        showlegend=False
+    )
+    return fig
+
+
+
+def plot_gender_pie(df):
+    gc = agg_gender(df)
+    fig = go.Figure(go.Pie(
+        labels=gc['profile_gender'].tolist(),
+        values=gc['count'].values,
+        hole=0.3,
+        marker=dict(colors=COLOR_SEQ)
+    ))
+    fig.update_traces(textposition='inside', textinfo='percent+label')
+    fig.update_layout(**BASE_LAYOUT,
+                      title="Gender Split of Astronauts",
+                      showlegend=False)
+    return fig
+
+# Plot 4: Choropleth map of unique astronauts per country
+# NOTE: shows the all-time total per country (precomputed in load_data);
+# the sidebar filters deliberately don't apply to this map.
+def plot_choropleth(counts):
+    fig_choro = go.Figure(go.Choropleth(
+        locations=counts.index.tolist(),
+        z=counts.values,
+        locationmode='country names',
+        colorscale='Plasma',
+        text=counts.index.tolist()
+    ))
+    fig_choro.update_layout(title='Astronaut Country of Origin')
+    # Make background transparent
+    fig_choro.update_layout(
+        **BASE_LAYOUT,
+        paper_bgcolor='rgba(0,0,0,0)',
+        plot_bgcolor='rgba(0,0,0,0)',
+        geo=dict(showframe=False, showcoastlines=True),
+        margin=dict(l=0, r=0, t=50, b=0)
+    )
+
+    return fig_choro
+
+# 5) Pie chart of EVA activity (duration > 0)
+def plot_eva_pie(df):
+    ec = agg_eva(df)
+    fig = go.Figure(go.Pie(
+        labels=['yes' if k else 'no' for k in ec['profile_eva_activity']],
+        values=ec['count'].values,
+        hole=0.3,
+        marker=dict(colors=COLOR_SEQ)
+    ))
+    fig.update_traces(textposition='inside', textinfo='percent+label')
+    fig.update_layout(title="EVA Activity (Any EVA vs. None)",
+                      height=600)
+    return fig